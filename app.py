@@ -2,9 +2,14 @@ import os
 import streamlit as st
 from openai import AuthenticationError, RateLimitError
 
-from chatbot import YouTubeChatbot
+import config
 from youtube_utils import extract_video_id, TranscriptsDisabled, NoTranscriptFound
 
+# Configure logging once per session rather than on every rerun
+if "logging_configured" not in st.session_state:
+    config.configure_logging()
+    st.session_state.logging_configured = True
+
 # Page configuration 
 st.set_page_config(
     page_title="YouTube Video Q&A Chatbot",
@@ -117,6 +122,20 @@ with col1:
         key="url_input"
     )
 
+# Chatbots are shared across sessions so OpenAI clients and FAISS indexes stay warm
+@st.cache_resource(
+    show_spinner=False,
+    max_entries=config.CHATBOT_CACHE_MAX_ENTRIES,
+    ttl=config.CHATBOT_CACHE_TTL_SECONDS
+)
+def get_chatbot_for(video_id: str, api_key: str):
+    # Imported here so the initial page render doesn't pay for LangChain/FAISS
+    from chatbot import YouTubeChatbot
+    
+    chatbot = YouTubeChatbot(api_key=api_key)
+    chatbot.process_video(video_id)
+    return chatbot
+
 # Initialize session state for storing the chatbot instance
 if 'chatbot' not in st.session_state:
     st.session_state.chatbot = None
@@ -153,18 +172,11 @@ if process_button:
                 if (st.session_state.chatbot is None or 
                     st.session_state.current_video_id != video_id):
                     
-                    # Initialize chatbot
-                    st.session_state.chatbot = YouTubeChatbot()
-                    
-                    # Process the video
-                    success = st.session_state.chatbot.process_video(video_url)
-                    
-                    if success:
-                        st.session_state.video_processed = True
-                        st.session_state.current_video_id = video_id
-                        st.success("✅ Video processed successfully! You can now ask questions.")
-                    else:
-                        st.error("❌ Failed to process video. Please check the URL and try again.")
+                    # Get (or build) the shared chatbot for this video
+                    st.session_state.chatbot = get_chatbot_for(video_id, api_key)
+                    st.session_state.video_processed = True
+                    st.session_state.current_video_id = video_id
+                    st.success("✅ Video processed successfully! You can now ask questions.")
                 else:
                     st.info("ℹ️ Video already processed. You can ask questions below.")
                     
@@ -189,8 +201,17 @@ if st.session_state.video_processed and st.session_state.chatbot is not None:
     question = st.text_area(
         "Your question about the video",
         placeholder="What is the main topic of this video?",
-        height=100
+        height=100,
+        help="Enter one question per line to ask several at once"
+    )
+    
+    answer_mode = st.radio(
+        "Answer mode",
+        ["⚡ Fast", "🎯 Quality"],
+        horizontal=True,
+        help=f"Fast uses {config.LLM_MODEL}, Quality uses {config.LLM_QUALITY_MODEL}"
     )
+    answer_model = config.LLM_QUALITY_MODEL if answer_mode == "🎯 Quality" else config.LLM_MODEL
     
     # Create columns for better button layout
     _, col_btn, _ = st.columns([1, 2, 1])
@@ -199,20 +220,41 @@ if st.session_state.video_processed and st.session_state.chatbot is not None:
         answer_button = st.button("🔍 Get Answer")
     
     if answer_button:
-        if not question:
+        questions = [line.strip() for line in question.splitlines() if line.strip()]
+        
+        if not questions:
             st.warning("⚠️ Please enter a question")
-        else:
+        elif len(questions) > 1:
             with st.spinner("🧠 Thinking..."):
                 try:
-                    # Get answer from chatbot
-                    answer = st.session_state.chatbot.ask(question)
+                    # Answer all questions in a single request
+                    answers = st.session_state.chatbot.ask_many(questions, model=answer_model)
                     
-                    # Display answer 
-                    st.markdown("<p class='section-header'>💬 Answer</p>", unsafe_allow_html=True)
-                    st.markdown(f"<div class='response-container'>{answer}</div>", unsafe_allow_html=True)
+                    st.markdown("<p class='section-header'>💬 Answers</p>", unsafe_allow_html=True)
+                    for q, answer in zip(questions, answers):
+                        with st.container(border=True):
+                            st.markdown(f"**{q}**")
+                            st.markdown(answer)
                     
                 except Exception as e:
                     st.error(f"❌ An error occurred: {str(e)}")
+        else:
+            try:
+                # Start retrieval while the answer section renders
+                chatbot = st.session_state.chatbot
+                prompt_future = chatbot.prefetch_context(question, model=answer_model)
+                
+                # Display answer, rendering tokens as they arrive
+                st.markdown("<p class='section-header'>💬 Answer</p>", unsafe_allow_html=True)
+                with st.container(border=True):
+                    st.write_stream(chatbot.ask_stream(
+                        question,
+                        model=answer_model,
+                        prompt_future=prompt_future
+                    ))
+                
+            except Exception as e:
+                st.error(f"❌ An error occurred: {str(e)}")
 
 #  if no video is processed yet
 if not st.session_state.video_processed:
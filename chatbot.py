@@ -7,23 +7,94 @@ including text processing, embedding generation, and question answering.
 """
 
 import os
+import re
+import math
+import time
+import threading
+import weakref
+import uuid
+import pickle
+import shutil
+import asyncio
+import hashlib
 import logging
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_community.vectorstores import FAISS
-from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableParallel, RunnablePassthrough, RunnableLambda
-from langchain_core.output_parsers import StrOutputParser
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator
 from openai import AuthenticationError, RateLimitError, APIConnectionError
 
 import config
 from youtube_utils import get_transcript, extract_video_id, validate_youtube_url
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = Path(config.VECTORSTORE_CACHE_DIR)
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket that paces requests under a per-minute limit.
+    
+    Waiting here up front is cheaper than hitting 429 responses and sitting
+    through the client's exponential backoff.
+    """
+    
+    def __init__(self, requests_per_minute: int):
+        self.capacity = float(requests_per_minute)
+        self.tokens = self.capacity
+        self.rate = requests_per_minute / 60.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, n: int = 1) -> None:
+        """
+        Block until `n` requests may be sent.
+        """
+        n = min(float(n), self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# The limit applies to the whole OpenAI account, so all chatbots share one bucket
+_rate_limiter = _RateLimiter(config.OPENAI_RPM)
+
+
+def _bm25_tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens for BM25, ignoring punctuation.
+    """
+    return re.findall(r"\w+", text.lower())
+
+
+def _release_resources(http_client: Any, executor: ThreadPoolExecutor) -> None:
+    """
+    Close a chatbot's HTTP connection pool and shut down its background worker.
+    """
+    executor.shutdown(wait=False)
+    http_client.close()
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> Any:
+    """
+    Get the tiktoken encoding for the configured LLM, loaded on first use.
+    """
+    import tiktoken
+    
+    try:
+        return tiktoken.encoding_for_model(config.LLM_MODEL)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
 
 class YouTubeChatbot:
     """
@@ -50,16 +121,38 @@ class YouTubeChatbot:
             raise ValueError("OpenAI API key is missing. Please provide an API key.")
             
         try:
-            self.llm = ChatOpenAI(
-                model=config.LLM_MODEL,
-                temperature=config.LLM_TEMPERATURE
+            # Imported lazily to keep module import (and Streamlit reruns) fast
+            from langchain_openai import OpenAIEmbeddings
+            from langchain_core.prompts import PromptTemplate
+            import httpx
+            
+            # One keep-alive HTTP/2 connection pool shared by every OpenAI client.
+            # Only synchronous calls go through it: async methods (ainvoke,
+            # aembed_*) would use the library's own AsyncClient, so this class
+            # runs OpenAI calls on worker threads rather than through asyncio.
+            self._http = httpx.Client(
+                http2=True,
+                timeout=60,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+            )
+            # Background worker for fetching context ahead of the LLM call
+            self._executor = ThreadPoolExecutor(max_workers=2)
+            
+            # Release both when the chatbot is garbage-collected or at exit,
+            # without keeping the chatbot itself alive
+            self._finalizer = weakref.finalize(
+                self, _release_resources, self._http, self._executor
             )
             
-            self.embeddings = OpenAIEmbeddings(model=config.EMBEDDING_MODEL)
+            self.llm = self._create_llm(config.LLM_MODEL)
             
-            self.text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=config.CHUNK_SIZE,
-                chunk_overlap=config.CHUNK_OVERLAP
+            self.embeddings = OpenAIEmbeddings(
+                model=config.EMBEDDING_MODEL,
+                chunk_size=config.EMBEDDING_BATCH_SIZE,
+                max_retries=3,
+                request_timeout=30,
+                http_client=self._http,
+                api_key=self.api_key
             )
             
             self.prompt = PromptTemplate(
@@ -74,9 +167,30 @@ class YouTubeChatbot:
                 input_variables=['context', 'question']
             )
             
+            self.batch_prompt = PromptTemplate(
+                template="""
+                You are a helpful assistant.
+                Answer ONLY from the provided transcript context.
+                If the context is insufficient for a question, just say you don't know.
+                Answer each question independently and return the answers as a JSON
+                list of strings, in the same order as the questions.
+
+                {context}
+                Questions:
+                {questions}
+                """,
+                input_variables=['context', 'questions']
+            )
+            
             self.vector_store = None
+            # Recent answers, keyed by (model, normalized question), plus the
+            # question embeddings used to match near-identical rephrasings
+            self._qa_cache: Dict[tuple, str] = {}
+            self._q_vecs: List[tuple] = []
+            self._qa_lock = threading.Lock()
+            
+            self.bm25 = None
             self.retriever = None
-            self.chain = None
                 
         except AuthenticationError as e:
             logger.error(f"Authentication error: {e}")
@@ -102,34 +216,107 @@ class YouTubeChatbot:
         Raises:
             ValueError: If the video URL is invalid or transcript cannot be retrieved
         """
+        return asyncio.run(self.aprocess_video(video_url_or_id))
+    
+    async def aprocess_video(self, video_url_or_id: str) -> bool:
+        """
+        Async version of process_video.
+        
+        The transcript fetch overlaps with a warmup embedding request so the
+        shared OpenAI connection is already open when the chunks are embedded.
+        OpenAI calls run on worker threads so they use that shared sync pool.
+        
+        Args:
+            video_url_or_id: YouTube video URL or ID
+            
+        Returns:
+            True if processing was successful, False otherwise
+            
+        Raises:
+            ValueError: If the video URL is invalid or transcript cannot be retrieved
+        """
+        from langchain.retrievers import EnsembleRetriever
+        from langchain_community.retrievers import BM25Retriever
+        from langchain_community.vectorstores import FAISS
+        
         try:
             # Validate and extract video ID
             if not validate_youtube_url(video_url_or_id):
                 raise ValueError("Invalid YouTube URL or video ID format")
                 
             video_id = extract_video_id(video_url_or_id)
-            transcript = get_transcript(video_id)
+            cache_path = self._cache_path(video_id)
+            bm25_path = cache_path / "bm25.pkl"
             
-            if not transcript:
-                raise ValueError("Could not retrieve transcript for this video")
+            cached = None
+            if bm25_path.exists():
+                try:
+                    # Reuse the previously built indexes for this video
+                    cached = self._load_cache(cache_path)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable cache at {cache_path}: {e}")
+                    shutil.rmtree(cache_path, ignore_errors=True)
+                    
+            if cached is not None:
+                self.vector_store, texts, metadatas = cached
+            else:
+                transcript, _ = await asyncio.gather(
+                    asyncio.to_thread(get_transcript, video_id),
+                    asyncio.to_thread(self._warmup)
+                )
                 
-            # Split the transcript into chunks
-            chunks = self.text_splitter.create_documents([transcript])
-            
-            if not chunks:
-                raise ValueError("Failed to split transcript into chunks")
+                if not transcript:
+                    raise ValueError("Could not retrieve transcript for this video")
+                    
+                # Pack the transcript cues into chunks
+                chunks = self._pack_cues(transcript, config.CHUNK_SIZE, config.CHUNK_OVERLAP)
+                
+                if not chunks:
+                    raise ValueError("Failed to split transcript into chunks")
+                
+                # Embed all chunks in a single batched request
+                texts = [chunk.page_content for chunk in chunks]
+                batches = math.ceil(len(texts) / config.EMBEDDING_BATCH_SIZE)
+                await asyncio.to_thread(_rate_limiter.acquire, batches)
+                # Runs on the shared sync pool that _warmup just opened
+                vectors = await asyncio.to_thread(self.embeddings.embed_documents, texts)
+                
+                # Create vector store and persist it for later runs
+                metadatas = [chunk.metadata for chunk in chunks]
+                if len(chunks) >= config.IVF_MIN_CHUNKS:
+                    self.vector_store = self._build_ivf_store(texts, vectors, metadatas)
+                else:
+                    self.vector_store = FAISS.from_embeddings(
+                        list(zip(texts, vectors)),
+                        self.embeddings,
+                        metadatas=metadatas
+                    )
+                self._save_cache(cache_path, texts, metadatas)
             
-            # Create vector store
-            self.vector_store = FAISS.from_documents(chunks, self.embeddings)
+            # Keyword index to catch exact terms (e.g. names) dense search misses
+            self.bm25 = BM25Retriever.from_texts(
+                texts,
+                metadatas=metadatas,
+                preprocess_func=_bm25_tokenize,
+                k=config.RETRIEVAL_K
+            )
             
-            # Create retriever
-            self.retriever = self.vector_store.as_retriever(
-                search_type="similarity", 
-                search_kwargs={"k": config.RETRIEVAL_K}
+            # Create hybrid retriever, fusing dense and keyword results by rank
+            self.retriever = EnsembleRetriever(
+                retrievers=[
+                    self.vector_store.as_retriever(
+                        search_type="similarity", 
+                        search_kwargs={"k": config.RETRIEVAL_K}
+                    ),
+                    self.bm25
+                ],
+                weights=[0.5, 0.5]
             )
             
-            # Create the chain
-            self._create_chain()
+            # Cached answers belong to the previously processed video
+            with self._qa_lock:
+                self._qa_cache.clear()
+                self._q_vecs.clear()
             
             return True
             
@@ -140,29 +327,437 @@ class YouTubeChatbot:
             logger.error(f"Error processing video: {e}")
             raise ValueError(f"Error processing video: {str(e)}")
     
-    def _create_chain(self) -> None:
+    def _load_cache(self, cache_path: Path) -> tuple:
+        """
+        Load the saved FAISS index and BM25 corpus for a video.
+        
+        Args:
+            cache_path: The cache directory returned by _cache_path
+            
+        Returns:
+            A (vector store, texts, metadatas) tuple
+        """
+        from langchain_community.vectorstores import FAISS
+        
+        vector_store = FAISS.load_local(
+            str(cache_path),
+            self.embeddings,
+            allow_dangerous_deserialization=True
+        )
+        with open(cache_path / "bm25.pkl", "rb") as f:
+            texts, metadatas = pickle.load(f)
+        return vector_store, texts, metadatas
+    
+    def _save_cache(self, cache_path: Path, texts: List[str],
+                    metadatas: List[Dict[str, Any]]) -> None:
+        """
+        Save the FAISS index and BM25 corpus for a video.
+        
+        Files are written to a temporary directory that is then renamed into
+        place, so an interrupted write never leaves a partial cache behind.
+        
+        Args:
+            cache_path: The cache directory returned by _cache_path
+            texts: The chunk texts
+            metadatas: The metadata of each chunk
+        """
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.vector_store.save_local(str(tmp_path))
+            
+            # Save the keyword search corpus alongside the vector index
+            with open(tmp_path / "bm25.pkl", "wb") as f:
+                pickle.dump((texts, metadatas), f)
+                
+            shutil.rmtree(cache_path, ignore_errors=True)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # Another process may have written the same cache concurrently
+            logger.warning(f"Could not save cache at {cache_path}: {e}")
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+    
+    def _build_ivf_store(self, texts: List[str], vectors: List[List[float]],
+                         metadatas: List[Dict[str, Any]]) -> Any:
+        """
+        Build a FAISS vector store backed by an IndexIVFFlat index.
+        
+        Used for long transcripts, where brute-force search over every chunk
+        starts to dominate retrieval time.
+        
+        Args:
+            texts: The chunk texts
+            vectors: The embedding of each chunk
+            metadatas: The metadata of each chunk
+            
+        Returns:
+            A LangChain FAISS vector store
+        """
+        import faiss
+        import numpy as np
+        from langchain_community.docstore.in_memory import InMemoryDocstore
+        from langchain_community.vectorstores import FAISS
+        from langchain_core.documents import Document
+        
+        xb = np.asarray(vectors, dtype=np.float32)
+        d = xb.shape[1]
+        # faiss wants ~39 training points per list for stable centroids
+        nlist = max(1, min(64, int(math.sqrt(len(texts))), len(texts) // 39))
+        
+        quantizer = faiss.IndexFlatL2(d)
+        index = faiss.IndexIVFFlat(quantizer, d, nlist)
+        index.train(xb)
+        index.add(xb)
+        index.nprobe = min(nlist, config.IVF_NPROBE)
+        
+        ids = [str(uuid.uuid4()) for _ in texts]
+        docstore = InMemoryDocstore({
+            doc_id: Document(page_content=text, metadata=metadata)
+            for doc_id, text, metadata in zip(ids, texts, metadatas)
+        })
+        
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(ids))
+        )
+    
+    def _pack_cues(self, cues: List[Dict[str, Any]], size: int, overlap: int) -> List[Any]:
+        """
+        Pack transcript cues into documents of roughly `size` characters.
+        
+        Cues are accumulated in a single pass until the chunk reaches `size`
+        characters; the next chunk then starts with the trailing cues that fit
+        within `overlap` characters. Each document records the start time of
+        its first cue.
+        
+        Args:
+            cues: Transcript cues as returned by get_transcript
+            size: Target chunk size in characters
+            overlap: Number of characters to repeat between consecutive chunks
+            
+        Returns:
+            A list of LangChain Documents with a "start" timestamp in their metadata
+        """
+        from langchain_core.documents import Document
+        
+        chunks = []
+        window = []
+        length = 0
+        pending = False
+        
+        def emit():
+            chunks.append(Document(
+                page_content=" ".join(text for text, _ in window),
+                metadata={"start": window[0][1]}
+            ))
+        
+        for cue in cues:
+            text = " ".join(cue["text"].split())
+            if not text:
+                continue
+                
+            window.append((text, cue["start"]))
+            length += len(text) + 1
+            pending = True
+            
+            if length >= size:
+                emit()
+                pending = False
+                
+                # Carry the trailing cues that fit in the overlap into the next chunk
+                tail_length = 0
+                keep = 0
+                for text, _ in reversed(window[1:]):
+                    if tail_length + len(text) + 1 > overlap:
+                        break
+                    tail_length += len(text) + 1
+                    keep += 1
+                window = window[len(window) - keep:]
+                length = tail_length
+        
+        if pending:
+            emit()
+            
+        return chunks
+    
+    def _cache_path(self, video_id: str) -> Path:
+        """
+        Get the directory where the vector store for a video is cached.
+        
+        The path includes a hash of the chunking, embedding and index settings
+        so that changing them invalidates previously saved indexes.
+        
+        Args:
+            video_id: The YouTube video ID
+            
+        Returns:
+            The cache directory for this video and configuration
+        """
+        settings = (
+            f"cues:{config.CHUNK_SIZE}:{config.CHUNK_OVERLAP}:{config.EMBEDDING_MODEL}"
+            f":ivf:{config.IVF_MIN_CHUNKS}:{config.IVF_NPROBE}"
+        )
+        settings_hash = hashlib.sha1(settings.encode("utf-8")).hexdigest()[:12]
+        return CACHE_DIR / video_id / settings_hash
+    
+    def close(self) -> None:
+        """
+        Close the HTTP connection pool and the background worker.
+        """
+        self._finalizer()
+    
+    def _create_llm(self, model: str) -> Any:
+        """
+        Create a streaming chat model client.
+        
+        Args:
+            model: The OpenAI chat model name
+            
+        Returns:
+            A LangChain ChatOpenAI instance
+        """
+        from langchain_openai import ChatOpenAI
+        
+        return ChatOpenAI(
+            model=model,
+            temperature=config.LLM_TEMPERATURE,
+            streaming=True,
+            max_retries=5,
+            http_client=self._http,
+            api_key=self.api_key
+        )
+    
+    def _llm_for(self, model: Optional[str]) -> Any:
+        """
+        Get the chat model for a question: the shared one, or a short-lived
+        client when a different model is requested.
+        
+        Args:
+            model: Optional chat model name overriding the configured one
+            
+        Returns:
+            A LangChain ChatOpenAI instance
+        """
+        if model and model != self.llm.model_name:
+            return self._create_llm(model)
+        return self.llm
+    
+    @staticmethod
+    def _format_docs(retrieved_docs: List[Any]) -> str:
+        """
+        Join retrieved documents into the context text for the prompt.
+        
+        Documents are added in retrieval order until MAX_CONTEXT_TOKENS is
+        reached, so the prompt size stays bounded regardless of k.
         """
-        Create the LangChain processing chain for question answering.
+        encoding = _get_encoding()
+        budget = config.MAX_CONTEXT_TOKENS
+        
+        parts = []
+        used = 0
+        for doc in retrieved_docs:
+            tokens = encoding.encode(doc.page_content)
+            if used + len(tokens) > budget:
+                if not parts:
+                    # Always keep (the start of) the best match
+                    parts.append(encoding.decode(tokens[:budget]))
+                break
+            parts.append(doc.page_content)
+            used += len(tokens)
+            
+        context_text = "\n\n".join(parts)
+        return context_text
+    
+    def prefetch_context(self, question: str, model: Optional[str] = None) -> Optional[Future]:
         """
-        def format_docs(retrieved_docs):
-            context_text = "\n\n".join(doc.page_content for doc in retrieved_docs)
-            return context_text
+        Start embedding the question, retrieving context and formatting the
+        prompt in the background.
         
-        parallel_chain = RunnableParallel({
-            'context': self.retriever | RunnableLambda(format_docs),
-            'question': RunnablePassthrough()
+        Args:
+            question: The question to ask about the video
+            model: The chat model the question will be asked with, as passed
+                   to ask_stream
+            
+        Returns:
+            A future to be passed to ask_stream, or None if the answer is
+            already cached and there is nothing to prefetch
+            
+        Raises:
+            ValueError: If no video has been processed yet
+        """
+        if self.retriever is None:
+            raise ValueError("Please process a video first using process_video()")
+            
+        with self._qa_lock:
+            if self._question_key(question, model) in self._qa_cache:
+                return None
+                
+        return self._executor.submit(self._prepare, question)
+    
+    def _warmup(self) -> None:
+        """
+        Send a tiny embedding request to open the OpenAI connection early.
+        """
+        _rate_limiter.acquire()
+        self.embeddings.embed_query("warmup")
+    
+    def _question_key(self, question: str, model: Optional[str]) -> tuple:
+        """
+        Get the answer cache key for a question: (model, normalized question).
+        """
+        return (model or self.llm.model_name, " ".join(question.lower().split()))
+    
+    def _embed_question(self, question: str) -> List[float]:
+        """
+        Embed a question once, for both the answer cache and retrieval.
+        """
+        _rate_limiter.acquire()
+        return self.embeddings.embed_query(question)
+    
+    def _retrieve(self, question: str, vector: List[float]) -> Any:
+        """
+        Run hybrid retrieval and prompt formatting for an embedded question.
+        
+        Dense search uses the precomputed embedding instead of embedding the
+        question again, and its results are fused with BM25 as in self.retriever.
+        """
+        dense_docs = self.vector_store.similarity_search_by_vector(vector, k=config.RETRIEVAL_K)
+        keyword_docs = self.bm25.invoke(question)
+        docs = self.retriever.weighted_reciprocal_rank([dense_docs, keyword_docs])
+        return self.prompt.invoke({
+            'context': self._format_docs(docs),
+            'question': question
         })
+    
+    def _prepare(self, question: str) -> tuple:
+        """
+        Embed a question and retrieve its prompt; the body of prefetch_context.
         
-        parser = StrOutputParser()
+        Returns:
+            A (question embedding, formatted prompt) tuple
+        """
+        vector = self._embed_question(question)
+        return vector, self._retrieve(question, vector)
+    
+    def _similar_answer(self, key: tuple, vector: List[float]) -> Optional[str]:
+        """
+        Find a cached answer to a near-identical question for the same model.
         
-        self.chain = parallel_chain | self.prompt | self.llm | parser
+        Args:
+            key: Cache key from _question_key
+            vector: The question embedding
+            
+        Returns:
+            The cached answer, or None if no prior question is similar enough
+        """
+        import numpy as np
+        
+        vector = np.asarray(vector, dtype=np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        
+        with self._qa_lock:
+            for cached_vector, cached_key in self._q_vecs:
+                if (cached_key[0] == key[0]
+                        and float(vector @ cached_vector) > config.QA_CACHE_SIMILARITY
+                        and cached_key in self._qa_cache):
+                    return self._qa_cache[cached_key]
+                    
+        return None
+    
+    def _store_answer(self, key: tuple, vector: List[float], answer: str) -> None:
+        """
+        Cache an answer, evicting the oldest entries beyond QA_CACHE_SIZE.
+        """
+        import numpy as np
+        
+        vector = np.asarray(vector, dtype=np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        
+        with self._qa_lock:
+            self._qa_cache[key] = answer
+            self._q_vecs.append((vector, key))
+            
+            while len(self._qa_cache) > config.QA_CACHE_SIZE:
+                self._qa_cache.pop(next(iter(self._qa_cache)))
+            while len(self._q_vecs) > config.QA_CACHE_SIZE:
+                self._q_vecs.pop(0)
+    
+    def ask_stream(self, question: str, model: Optional[str] = None,
+                   prompt_future: Optional[Future] = None) -> Iterator[str]:
+        """
+        Ask a question about the processed YouTube video, streaming the answer.
+        
+        Args:
+            question: The question to ask about the video
+            model: Optional chat model to use for this question only. Defaults
+                   to the model from config.
+            prompt_future: Optional result of prefetch_context for this question.
+                           If not provided, retrieval runs here.
+            
+        Yields:
+            Chunks of the answer text as they are generated by the LLM
+            
+        Raises:
+            ValueError: If no video has been processed yet or other errors occur
+        """
+        if self.retriever is None:
+            raise ValueError("Please process a video first using process_video()")
+            
+        from langchain_core.output_parsers import StrOutputParser
+        
+        llm_chain = self._llm_for(model) | StrOutputParser()
+        key = self._question_key(question, model)
+        
+        try:
+            # Repeated questions are answered from the cache without any API call
+            with self._qa_lock:
+                cached = self._qa_cache.get(key)
+            if cached is not None:
+                if prompt_future is not None:
+                    prompt_future.cancel()
+                yield cached
+                return
+                
+            prompt_value = None
+            if prompt_future is not None:
+                vector, prompt_value = prompt_future.result()
+            else:
+                vector = self._embed_question(question)
+                
+            # Near-identical rephrasings reuse the same answer
+            cached = self._similar_answer(key, vector)
+            if cached is not None:
+                yield cached
+                return
+                
+            if prompt_value is None:
+                prompt_value = self._retrieve(question, vector)
+                
+            parts = []
+            _rate_limiter.acquire()
+            for chunk in llm_chain.stream(prompt_value):
+                parts.append(chunk)
+                yield chunk
+                
+            self._store_answer(key, vector, "".join(parts))
+        except AuthenticationError as e:
+            raise ValueError(f"Authentication error: {str(e)}")
+        except RateLimitError as e:
+            raise ValueError(f"Rate limit exceeded: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error generating answer: {e}")
+            raise ValueError(f"Error generating answer: {str(e)}")
     
-    def ask(self, question: str) -> str:
+    def ask(self, question: str, model: Optional[str] = None) -> str:
         """
         Ask a question about the processed YouTube video.
         
         Args:
             question: The question to ask about the video
+            model: Optional chat model to use for this question only. Defaults
+                   to the model from config.
             
         Returns:
             The answer to the question based on the video transcript
@@ -170,15 +765,64 @@ class YouTubeChatbot:
         Raises:
             ValueError: If no video has been processed yet or other errors occur
         """
-        if not self.chain:
+        return "".join(self.ask_stream(question, model=model))
+    
+    def ask_many(self, questions: List[str], model: Optional[str] = None) -> List[str]:
+        """
+        Ask several questions about the processed YouTube video in one LLM request.
+        
+        Context is retrieved for every question, deduplicated and shared by a
+        single prompt that asks for all answers at once.
+        
+        Args:
+            questions: The questions to ask about the video
+            model: Optional chat model to use for these questions only. Defaults
+                   to the model from config.
+            
+        Returns:
+            The answers, in the same order as the questions
+            
+        Raises:
+            ValueError: If no video has been processed yet or other errors occur
+        """
+        if self.retriever is None:
             raise ValueError("Please process a video first using process_video()")
             
+        if not questions:
+            return []
+            
+        from langchain_core.output_parsers import JsonOutputParser
+        
+        llm = self._llm_for(model)
+        
         try:
-            return self.chain.invoke(question)
+            _rate_limiter.acquire(len(questions))
+            results = self.retriever.batch(questions)
+            
+            # Union of the retrieved chunks, interleaved round-robin by rank so
+            # every question keeps its best matches within the token budget
+            docs = {}
+            for rank in range(max(len(retrieved_docs) for retrieved_docs in results)):
+                for retrieved_docs in results:
+                    if rank < len(retrieved_docs):
+                        docs.setdefault(retrieved_docs[rank].page_content, retrieved_docs[rank])
+                    
+            numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, start=1))
+            chain = self.batch_prompt | llm | JsonOutputParser()
+            _rate_limiter.acquire()
+            answers = chain.invoke({
+                'context': self._format_docs(list(docs.values())),
+                'questions': numbered
+            })
+            
+            if not isinstance(answers, list) or len(answers) != len(questions):
+                raise ValueError("Model returned an unexpected number of answers")
+                
+            return [str(answer) for answer in answers]
         except AuthenticationError as e:
             raise ValueError(f"Authentication error: {str(e)}")
         except RateLimitError as e:
             raise ValueError(f"Rate limit exceeded: {str(e)}")
         except Exception as e:
-            logger.error(f"Error generating answer: {e}")
-            raise ValueError(f"Error generating answer: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error generating answers: {e}")
+            raise ValueError(f"Error generating answers: {str(e)}")
\ No newline at end of file
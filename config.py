@@ -8,6 +8,7 @@ rather than hardcoded here.
 """
 
 import os
+import logging
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if present
@@ -17,12 +18,21 @@ load_dotenv()
 # Note: API key should be provided at runtime, not hardcoded here
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
+# Requests per minute allowed by the OpenAI account; calls are paced to stay under it
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+
 # LLM configuration
-LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o")
+LLM_MODEL = os.getenv("LLM_MODEL") or "gpt-4o-mini"
+# Slower, higher quality model offered as an opt-in per question
+LLM_QUALITY_MODEL = os.getenv("LLM_QUALITY_MODEL") or "gpt-4o"
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.2"))
 
 # Embedding configuration
-EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL") or "text-embedding-3-small"
+# Number of chunks sent per embeddings request. The API accepts at most 2048
+# inputs and 300k tokens per request; 512 chunks of CHUNK_SIZE=1000 characters
+# (~250-300 tokens each) stay well under both. Lower this for larger chunks.
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "512"))
 
 # Text splitting configuration
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
@@ -30,6 +40,38 @@ CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "200"))
 
 # Retrieval configuration
 RETRIEVAL_K = int(os.getenv("RETRIEVAL_K", "4"))
+# Upper bound on the number of context tokens sent to the LLM per prompt
+MAX_CONTEXT_TOKENS = int(os.getenv("MAX_CONTEXT_TOKENS", "1500"))
+
+# Answer cache: number of recent answers kept and the cosine similarity above
+# which a new question is treated as a repeat of a cached one
+QA_CACHE_SIZE = int(os.getenv("QA_CACHE_SIZE", "128"))
+QA_CACHE_SIMILARITY = float(os.getenv("QA_CACHE_SIMILARITY", "0.97"))
+
+# Transcripts with at least this many chunks use an IVF index instead of brute-force search
+IVF_MIN_CHUNKS = int(os.getenv("IVF_MIN_CHUNKS", "500"))
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", "8"))
 
 # Default language for transcripts
-DEFAULT_TRANSCRIPT_LANGUAGE = os.getenv("DEFAULT_TRANSCRIPT_LANGUAGE", "en")
\ No newline at end of file
+DEFAULT_TRANSCRIPT_LANGUAGE = os.getenv("DEFAULT_TRANSCRIPT_LANGUAGE", "en")
+
+# Streamlit app: number of processed videos kept in memory, and for how long
+CHATBOT_CACHE_MAX_ENTRIES = int(os.getenv("CHATBOT_CACHE_MAX_ENTRIES", "8"))
+CHATBOT_CACHE_TTL_SECONDS = int(os.getenv("CHATBOT_CACHE_TTL_SECONDS", "3600"))
+
+# Transcript cache configuration
+TRANSCRIPT_CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", os.path.expanduser("~/.cache/yt_chatbot"))
+TRANSCRIPT_CACHE_DAYS = int(os.getenv("TRANSCRIPT_CACHE_DAYS", "7"))
+
+# Vector store cache configuration
+VECTORSTORE_CACHE_DIR = os.getenv("VECTORSTORE_CACHE", "./.vs_cache")
+
+
+def configure_logging() -> None:
+    """
+    Configure root logging for the application entry points.
+    
+    Kept out of module import so library modules don't reconfigure
+    logging every time they are (re)imported.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
\ No newline at end of file
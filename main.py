@@ -5,6 +5,7 @@ Main entry point for the YouTube Chatbot application.
 This module provides a simple command-line interface to interact with
 the YouTube chatbot.\n"""
 
+import config
 from chatbot import YouTubeChatbot
 
 
@@ -12,6 +13,8 @@ def main():
     """
     Main function to run the YouTube chatbot application.
     """
+    config.configure_logging()
+    
     print("YouTube Chatbot")
     print("==============\n")
     
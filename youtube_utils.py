@@ -7,10 +7,23 @@ from YouTube videos.
 """
 
 import re
+from datetime import timedelta
+from functools import lru_cache
+from cachier import cachier
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Tuple
 
+import config
 
+# Matches a YouTube watch/short URL or a bare 11-character video ID,
+# capturing the ID in group 1 (URL) or group 2 (bare ID)
+_YT_RE = re.compile(
+    r'^(?:(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)'
+    r'([a-zA-Z0-9_-]{11})(?:[&?].*)?|([a-zA-Z0-9_-]{11}))$'
+)
+
+
+@lru_cache(maxsize=1024)
 def validate_youtube_url(url: str) -> bool:
     """
     Validate if the provided string is a valid YouTube URL or video ID.
@@ -21,13 +34,7 @@ def validate_youtube_url(url: str) -> bool:
     Returns:
         True if the URL or ID appears to be valid, False otherwise
     """
-    # Check if it's a valid YouTube URL
-    youtube_regex = r'(https?://)?(www\.)?(youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})'
-    
-    # Check if it's just a video ID (11 characters)
-    video_id_regex = r'^[a-zA-Z0-9_-]{11}$'
-    
-    return bool(re.match(youtube_regex, url) or re.match(video_id_regex, url))
+    return _YT_RE.match(url) is not None
 
 
 def extract_video_id(url: str) -> str:
@@ -43,30 +50,35 @@ def extract_video_id(url: str) -> str:
     Raises:
         ValueError: If the URL is not a valid YouTube URL or ID
     """
-    # Validate the URL first
-    if not validate_youtube_url(url):
+    match = _YT_RE.match(url)
+    if not match:
         raise ValueError("Invalid YouTube URL or video ID format")
         
-    # If it's already just an ID (no slashes or youtube domain)
-    if "/" not in url and "youtube.com" not in url and "youtu.be" not in url:
-        return url
-        
-    # Handle youtu.be format
-    if "youtu.be" in url:
-        return url.split("/")[-1].split("?")[0]
-        
-    # Handle youtube.com format
-    if "v=" in url:
-        video_id = url.split("v=")[1]
-        ampersand_pos = video_id.find("&")
-        if ampersand_pos != -1:
-            return video_id[:ampersand_pos]
-        return video_id
+    return match.group(1) or match.group(2)
+
+
+@cachier(
+    stale_after=timedelta(days=config.TRANSCRIPT_CACHE_DAYS),
+    cache_dir=config.TRANSCRIPT_CACHE_DIR
+)
+def _fetch_transcript_raw(video_id: str, languages: Tuple[str, ...]) -> List[Dict]:
+    """
+    Fetch the raw transcript entries for a YouTube video.
+    
+    Results are cached on disk so repeat requests for the same video
+    do not hit the YouTube Transcript API again.
+    
+    Args:
+        video_id: The YouTube video ID
+        languages: Tuple of language codes to try, in order of preference
         
-    return url
+    Returns:
+        The list of transcript entries returned by the API
+    """
+    return YouTubeTranscriptApi.get_transcript(video_id, languages=list(languages))
 
 
-def get_transcript(video_id: str, languages: List[str] = ["en"]) -> str:
+def get_transcript(video_id: str, languages: List[str] = ["en"]) -> List[Dict]:
     """
     Get the transcript for a YouTube video.
     
@@ -75,7 +87,8 @@ def get_transcript(video_id: str, languages: List[str] = ["en"]) -> str:
         languages: List of language codes to try, in order of preference
         
     Returns:
-        The transcript text as a single string
+        The transcript as a list of caption cues, each a dict with
+        "text", "start" and "duration" keys
         
     Raises:
         TranscriptsDisabled: If transcripts are disabled for the video
@@ -84,15 +97,12 @@ def get_transcript(video_id: str, languages: List[str] = ["en"]) -> str:
     """
     try:
         # Get the transcript in the specified languages
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
-        
-        # Flatten it to plain text
-        transcript = " ".join(chunk["text"] for chunk in transcript_list)
+        transcript_list = _fetch_transcript_raw(video_id, tuple(languages))
         
-        if not transcript.strip():
+        if not any(cue["text"].strip() for cue in transcript_list):
             raise ValueError("Empty transcript retrieved")
             
-        return transcript
+        return transcript_list
         
     except TranscriptsDisabled:
         raise TranscriptsDisabled(f"No captions available for video ID: {video_id}")